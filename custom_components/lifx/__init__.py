@@ -192,7 +192,6 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         # that are moving to this config entry.
         async_migrate_entities_devices(hass, legacy_entry.entry_id, entry)
 
-    assert entry.unique_id is not None
     domain_data = hass.data[DOMAIN]
     if DATA_LIFX_MANAGER not in domain_data:
         manager = LIFXManager(hass)
@@ -226,6 +225,7 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     domain_data = hass.data[DOMAIN]
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
         coordinator: LIFXUpdateCoordinator = domain_data.pop(entry.entry_id)
+        coordinator.async_cancel_identify()
         coordinator.connection.async_stop()
     # Only the DATA_LIFX_MANAGER left, remove it.
     if len(domain_data) == 1:
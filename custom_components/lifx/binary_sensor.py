@@ -14,7 +14,6 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from .const import DOMAIN, HEV_CYCLE_STATE
 from .coordinator import LIFXUpdateCoordinator
 from .entity import LIFXEntity
-from .util import lifx_features
 
 HEV_CYCLE_STATE_SENSOR = BinarySensorEntityDescription(
     key=HEV_CYCLE_STATE,
@@ -30,7 +29,7 @@ async def async_setup_entry(
     """Set up LIFX from a config entry."""
     coordinator: LIFXUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    if lifx_features(coordinator.device)["hev"]:
+    if coordinator.features["hev"]:
         async_add_entities(
             [LIFXHevCycleBinarySensorEntity(coordinator, HEV_CYCLE_STATE_SENSOR)]
         )
@@ -29,6 +29,8 @@ from .util import (
     mac_matches_serial_number,
 )
 
+USER_SCHEMA = vol.Schema({vol.Optional(CONF_HOST, default=""): str})
+
 
 class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for LIFX."""
@@ -147,6 +149,7 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             host = user_input[CONF_HOST]
             if not host:
                 return await self.async_step_pick_device()
+            self._async_abort_entries_match({CONF_HOST: host})
             if (
                 device := await self._async_try_connect(host, raise_on_progress=False)
             ) is None:
@@ -156,7 +159,7 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="user",
-            data_schema=vol.Schema({vol.Optional(CONF_HOST, default=""): str}),
+            data_schema=USER_SCHEMA,
             errors=errors,
         )
 
@@ -168,6 +171,7 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             serial = user_input[CONF_DEVICE]
             await self.async_set_unique_id(serial, raise_on_progress=False)
             device_without_label = self._discovered_devices[serial]
+            self._async_abort_entries_match({CONF_HOST: device_without_label.ip_addr})
             device = await self._async_try_connect(
                 device_without_label.ip_addr, raise_on_progress=False
             )
@@ -213,7 +217,6 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         self, host: str, serial: str | None = None, raise_on_progress: bool = True
     ) -> Light | None:
         """Try to connect."""
-        self._async_abort_entries_match({CONF_HOST: host})
         connection = LIFXConnection(host, TARGET_ANY)
         try:
             await connection.async_setup()
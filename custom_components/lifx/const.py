@@ -6,7 +6,6 @@ DOMAIN = "lifx"
 
 TARGET_ANY = "00:00:00:00:00:00"
 
-DISCOVERY_INTERVAL = 10
 MESSAGE_TIMEOUT = 1.65
 MESSAGE_RETRIES = 5
 OVERALL_TIMEOUT = 9
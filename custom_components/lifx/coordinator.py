@@ -3,10 +3,10 @@ from __future__ import annotations
 
 import asyncio
 from collections.abc import Awaitable, Callable
-from datetime import timedelta
+from datetime import datetime, timedelta
 from enum import IntEnum
-from functools import partial
 from math import floor, log10
+import random
 from time import monotonic
 from typing import Any, cast
 
@@ -17,7 +17,7 @@ from aiolifx.aiolifx import (
     TileEffectType,
 )
 from aiolifx.connection import LIFXConnection
-from aiolifx_themes.themes import ThemeLibrary, ThemePainter
+from aiolifx_themes.themes import ThemePainter
 from awesomeversion import AwesomeVersion
 
 from homeassistant.const import (
@@ -25,10 +25,11 @@ from homeassistant.const import (
     SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
     Platform,
 )
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .const import (
@@ -41,6 +42,7 @@ from .const import (
     UNAVAILABLE_GRACE,
 )
 from .util import (
+    THEME_LIBRARY,
     async_execute_lifx,
     get_real_mac_addr,
     infrared_brightness_option_to_value,
@@ -49,8 +51,10 @@ from .util import (
 )
 
 LIGHT_UPDATE_INTERVAL = 10
+MAX_LIGHT_UPDATE_INTERVAL = LIGHT_UPDATE_INTERVAL * 5
 SENSOR_UPDATE_INTERVAL = 30
 REQUEST_REFRESH_DELAY = 0.35
+MESSAGE_DRAIN_INTERVAL = 0.05
 LIFX_IDENTIFY_DELAY = 3.0
 RSSI_DBM_FW = AwesomeVersion("2.77")
 MAX_TIMEOUTS_TO_DECLARE_UPDATE_FAILED = 3
@@ -82,9 +86,13 @@ class LIFXUpdateCoordinator(DataUpdateCoordinator[None]):
         self.active_effect = FirmwareEffect.OFF
         self._update_rssi: bool = False
         self._rssi: int = 0
+        self._last_rssi_update: float = 0.0
         self.last_used_theme: str = ""
         self._timeouts = 0
         self._offline_time: float = 0.0
+        self._features: dict[str, Any] | None = None
+        self._painter = ThemePainter(hass.loop)
+        self._cancel_identify_off: CALLBACK_TYPE | None = None
 
         super().__init__(
             hass,
@@ -105,6 +113,20 @@ class LIFXUpdateCoordinator(DataUpdateCoordinator[None]):
         self.device.retry_count = MESSAGE_RETRIES
         self.device.unregister_timeout = UNAVAILABLE_GRACE
 
+    @property
+    def features(self) -> dict[str, Any]:
+        """Return the feature map for the device.
+
+        The product never changes once it is known, so the map is cached
+        after the first successful get_version.
+        """
+        if self._features is not None:
+            return self._features
+        features = lifx_features(self.device)
+        if self.device.product is not None:
+            self._features = features
+        return features
+
     @property
     def rssi(self) -> int:
         """Return stored RSSI value."""
@@ -146,7 +168,7 @@ class LIFXUpdateCoordinator(DataUpdateCoordinator[None]):
 
     async def diagnostics(self) -> dict[str, Any]:
         """Return diagnostic information about the device."""
-        features = lifx_features(self.device)
+        features = self.features
         device_data = {
             "firmware": self.device.host_firmware_version,
             "vendor": self.device.vendor,
@@ -160,15 +182,20 @@ class LIFXUpdateCoordinator(DataUpdateCoordinator[None]):
         }
 
         if features["multizone"] is True:
-            zones = {"count": self.device.zones_count, "state": {}}
-            for index, zone_color in enumerate(self.device.color_zones):
-                zones["state"][index] = {
-                    "hue": zone_color[0],
-                    "saturation": zone_color[1],
-                    "brightness": zone_color[2],
-                    "kelvin": zone_color[3],
-                }
-            device_data["zones"] = zones
+            device_data["zones"] = {
+                "count": self.device.zones_count,
+                "state": {
+                    index: {
+                        "hue": hue,
+                        "saturation": saturation,
+                        "brightness": brightness,
+                        "kelvin": kelvin,
+                    }
+                    for index, (hue, saturation, brightness, kelvin) in enumerate(
+                        self.device.color_zones
+                    )
+                },
+            }
 
         if features["hev"] is True:
             device_data["hev"] = {
@@ -191,85 +218,113 @@ class LIFXUpdateCoordinator(DataUpdateCoordinator[None]):
 
     async def _async_update_data(self) -> None:
         """Fetch all device data from the api."""
+        while True:
+            try:
+                await self._async_fetch_data()
+            except asyncio.TimeoutError as ex:
+                self._timeouts += 1
+
+                if self._timeouts >= MAX_TIMEOUTS_TO_DECLARE_UPDATE_FAILED:
+                    self._offline_time = monotonic()
+                    self.update_interval = self._async_backoff_interval()
+                    raise UpdateFailed(
+                        f"The device failed to respond after {MAX_TIMEOUTS_TO_DECLARE_UPDATE_FAILED} attempts"
+                    ) from ex
 
-        try:
-            tasks: list[Awaitable] = [async_execute_lifx(self.device.get_color)]
-
-            if self.device.host_firmware_version is None:
-                tasks.append(async_execute_lifx(self.device.get_hostfirmware))
-            if self.device.product is None:
-                tasks.append(async_execute_lifx(self.device.get_version))
-            if self.device.group is None:
-                tasks.append(async_execute_lifx(self.device.get_group))
-
-            await asyncio.gather(*tasks)
+                _LOGGER.debug(
+                    "Incrementing timeout counter to %s after no reply from %s (%s)",
+                    self._timeouts,
+                    self.device.label,
+                    self.device.ip_addr,
+                )
+            else:
+                if self._timeouts > 0:
+                    _LOGGER.debug(
+                        "%s (%s) available after being offline for %.2f seconds",
+                        self.device.label or self.device.ip_addr,
+                        self.device.mac_addr,
+                        monotonic() - self._offline_time,
+                    )
+                    self._timeouts = 0
+                    self.update_interval = timedelta(seconds=LIGHT_UPDATE_INTERVAL)
+                return
+
+    def _async_backoff_interval(self) -> timedelta:
+        """Return a jittered exponential update interval for an offline device."""
+        failed_updates = self._timeouts - MAX_TIMEOUTS_TO_DECLARE_UPDATE_FAILED + 1
+        # 2**3 intervals mostly lands on the cap, don't grow the exponent forever
+        interval = LIGHT_UPDATE_INTERVAL * 2 ** min(failed_updates, 3)
+        return timedelta(
+            seconds=min(MAX_LIGHT_UPDATE_INTERVAL, interval * random.uniform(0.5, 1.5))
+        )
 
-            while len(self.device.message) > 0:
-                # let the loop run until all messages have replies or aiolifx times out waiting for them
-                await asyncio.sleep(0)  # pragma: no cover
+    async def _async_fetch_data(self) -> None:
+        """Send a single round of update requests to the device."""
+        tasks: list[Awaitable] = [async_execute_lifx(self.device.get_color)]
+        identify_tasks: list[Awaitable] = []
 
-            if self._update_rssi is True:
-                await self.async_update_rssi()
+        if self.device.host_firmware_version is None:
+            identify_tasks.append(async_execute_lifx(self.device.get_hostfirmware))
+        if self.device.product is None:
+            identify_tasks.append(async_execute_lifx(self.device.get_version))
+        if self.device.group is None:
+            identify_tasks.append(async_execute_lifx(self.device.get_group))
 
-            # Update extended multizone devices
-            if lifx_features(self.device)["extended_multizone"]:
-                await async_execute_lifx(self.device.get_extended_color_zones)
-                await self.async_get_multizone_effect()
-            # use legacy methods for older devices
-            elif lifx_features(self.device)["multizone"]:
-                await self.async_get_color_zones()
-                await self.async_get_multizone_effect()
+        if identify_tasks:
+            # The feature map needs the product so wait for it before
+            # deciding which of the remaining requests to send
+            await asyncio.gather(*tasks, *identify_tasks)
 
-            if lifx_features(self.device)["hev"]:
-                await self.async_get_hev_cycle()
+            while self.device.message:
+                # wait until all messages have replies or aiolifx times out waiting for them
+                await asyncio.sleep(MESSAGE_DRAIN_INTERVAL)  # pragma: no cover
 
-            if lifx_features(self.device)["infrared"]:
-                await async_execute_lifx(self.device.get_infrared)
+            tasks = []
 
-        except asyncio.TimeoutError as ex:
+        # The remaining requests are independent of each other so
+        # send them together rather than waiting for each reply
 
-            self._timeouts += 1
+        # Signal strength changes slowly so it is polled less often
+        if (
+            self._update_rssi is True
+            and monotonic() - self._last_rssi_update >= SENSOR_UPDATE_INTERVAL
+        ):
+            tasks.append(self.async_update_rssi())
 
-            if self._timeouts >= MAX_TIMEOUTS_TO_DECLARE_UPDATE_FAILED:
-                self._offline_time = monotonic()
-                raise UpdateFailed(
-                    f"The device failed to respond after {MAX_TIMEOUTS_TO_DECLARE_UPDATE_FAILED} attempts"
-                ) from ex
+        # Update extended multizone devices
+        if self.features["extended_multizone"]:
+            tasks.append(async_execute_lifx(self.device.get_extended_color_zones))
+            tasks.append(self.async_get_multizone_effect())
+        # use legacy methods for older devices
+        elif self.features["multizone"]:
+            tasks.append(self.async_get_color_zones())
+            tasks.append(self.async_get_multizone_effect())
 
-            _LOGGER.debug(
-                "Incrementing timeout counter to %s after no reply from %s (%s)",
-                self._timeouts,
-                self.device.label,
-                self.device.ip_addr,
-            )
+        if self.features["hev"]:
+            tasks.append(self.async_get_hev_cycle())
 
-            await self._async_update_data()
+        if self.features["infrared"]:
+            tasks.append(async_execute_lifx(self.device.get_infrared))
 
-        else:
-            if self._timeouts > 0:
-                _LOGGER.debug(
-                    "%s (%s) available after being offline for %.2f seconds",
-                    self.device.label or self.device.ip_addr,
-                    self.device.mac_addr,
-                    monotonic() - self._offline_time,
-                )
-                self._timeouts = 0
+        await asyncio.gather(*tasks)
 
     async def async_get_color_zones(self) -> None:
         """Get updated color information for each zone."""
-        zone = 0
-        top = 1
-        while zone < top:
-            # Each get_color_zones can update 8 zones at once
-            resp = await async_execute_lifx(
-                partial(self.device.get_color_zones, start_index=zone)
+        # The first reply tells us how many zones the device has now
+        resp = await async_execute_lifx(self.device.get_color_zones, start_index=0)
+        top = resp.count
+
+        # Each get_color_zones can update 8 zones at once, so request the
+        # remaining windows together. We only await multizone responses
+        # so never ask for just the last zone on its own.
+        await asyncio.gather(
+            *(
+                async_execute_lifx(
+                    self.device.get_color_zones, start_index=min(zone, top - 2)
+                )
+                for zone in range(8, top, 8)
             )
-            zone += 8
-            top = resp.count
-
-            # We only await multizone responses so don't ask for just one
-            if zone == top - 1:
-                zone -= 1
+        )
 
     async def async_get_extended_color_zones(self) -> None:
         """Get updated color information for all zones."""
@@ -285,7 +340,7 @@ class LIFXUpdateCoordinator(DataUpdateCoordinator[None]):
     ) -> None:
         """Send a set_waveform_optional message to the device."""
         await async_execute_lifx(
-            partial(self.device.set_waveform_optional, value=value, rapid=rapid)
+            self.device.set_waveform_optional, value=value, rapid=rapid
         )
 
     async def async_get_color(self) -> None:
@@ -294,17 +349,13 @@ class LIFXUpdateCoordinator(DataUpdateCoordinator[None]):
 
     async def async_set_power(self, state: bool, duration: int | None) -> None:
         """Send a set power message to the device."""
-        await async_execute_lifx(
-            partial(self.device.set_power, state, duration=duration)
-        )
+        await async_execute_lifx(self.device.set_power, state, duration=duration)
 
     async def async_set_color(
         self, hsbk: list[float | int | None], duration: int | None
     ) -> None:
         """Send a set color message to the device."""
-        await async_execute_lifx(
-            partial(self.device.set_color, hsbk, duration=duration)
-        )
+        await async_execute_lifx(self.device.set_color, hsbk, duration=duration)
 
     async def async_set_color_zones(
         self,
@@ -316,14 +367,12 @@ class LIFXUpdateCoordinator(DataUpdateCoordinator[None]):
     ) -> None:
         """Send a set color zones message to the device."""
         await async_execute_lifx(
-            partial(
-                self.device.set_color_zones,
-                start_index=start_index,
-                end_index=end_index,
-                color=hsbk,
-                duration=duration,
-                apply=apply,
-            )
+            self.device.set_color_zones,
+            start_index=start_index,
+            end_index=end_index,
+            color=hsbk,
+            duration=duration,
+            apply=apply,
         )
 
     async def async_set_extended_color_zones(
@@ -338,25 +387,26 @@ class LIFXUpdateCoordinator(DataUpdateCoordinator[None]):
         if colors_count is None:
             colors_count = len(colors)
 
-        # pad the color list with blanks if necessary
+        # pad the color list with blanks if necessary, without
+        # modifying the list that was passed in
         if len(colors) < 82:
-            for _ in range(82 - len(colors)):
-                colors.append((0, 0, 0, 0))
+            colors = colors + [(0, 0, 0, 0)] * (82 - len(colors))
 
         await async_execute_lifx(
-            partial(
-                self.device.set_extended_color_zones,
-                colors=colors,
-                colors_count=colors_count,
-                duration=duration,
-                apply=apply,
-            )
+            self.device.set_extended_color_zones,
+            colors=colors,
+            colors_count=colors_count,
+            duration=duration,
+            apply=apply,
         )
 
     async def async_get_multizone_effect(self) -> None:
         """Update the device firmware effect running state."""
         await async_execute_lifx(self.device.get_multizone_effect)
-        self.active_effect = FirmwareEffect[self.device.effect.get("effect", "OFF")]
+        # Treat effects added by newer firmware as no effect running
+        self.active_effect = FirmwareEffect.__members__.get(
+            self.device.effect.get("effect", "OFF"), FirmwareEffect.OFF
+        )
 
     async def async_set_multizone_effect(
         self,
@@ -367,23 +417,19 @@ class LIFXUpdateCoordinator(DataUpdateCoordinator[None]):
         power_on: bool = True,
     ) -> None:
         """Control the firmware-based Move effect on a multizone device."""
-        if lifx_features(self.device)["multizone"] is True:
+        if self.features["multizone"] is True:
             if power_on and self.device.power_level == 0:
                 await self.async_set_power(True, 0)
 
             if theme_name is not None:
-                theme = ThemeLibrary().get_theme(theme_name)
-                await ThemePainter(self.hass.loop).paint(
-                    theme, [self.device], round(speed)
-                )
+                theme = THEME_LIBRARY.get_theme(theme_name)
+                await self._painter.paint(theme, [self.device], round(speed))
 
             await async_execute_lifx(
-                partial(
-                    self.device.set_multizone_effect,
-                    effect=MultiZoneEffectType[effect.upper()].value,
-                    speed=speed,
-                    direction=MultiZoneDirection[direction.upper()].value,
-                )
+                self.device.set_multizone_effect,
+                effect=MultiZoneEffectType[effect.upper()].value,
+                speed=speed,
+                direction=MultiZoneDirection[direction.upper()].value,
             )
             self.active_effect = FirmwareEffect[effect.upper()]
 
@@ -395,7 +441,7 @@ class LIFXUpdateCoordinator(DataUpdateCoordinator[None]):
         power_on: bool = True,
     ) -> None:
         """Control the firmware-based effects on a matrix device."""
-        if lifx_features(self.device)["matrix"] is True:
+        if self.features["matrix"] is True:
             if power_on and self.device.power_level == 0:
                 await self.async_set_power(True, 0)
 
@@ -403,12 +449,10 @@ class LIFXUpdateCoordinator(DataUpdateCoordinator[None]):
                 palette = []
 
             await async_execute_lifx(
-                partial(
-                    self.device.set_tile_effect,
-                    effect=TileEffectType[effect.upper()].value,
-                    speed=speed,
-                    palette=palette,
-                )
+                self.device.set_tile_effect,
+                effect=TileEffectType[effect.upper()].value,
+                speed=speed,
+                palette=palette,
             )
             self.active_effect = FirmwareEffect[effect.upper()]
 
@@ -419,20 +463,57 @@ class LIFXUpdateCoordinator(DataUpdateCoordinator[None]):
     async def async_set_infrared_brightness(self, option: str) -> None:
         """Set infrared brightness."""
         infrared_brightness = infrared_brightness_option_to_value(option)
-        await async_execute_lifx(partial(self.device.set_infrared, infrared_brightness))
+        await async_execute_lifx(self.device.set_infrared, infrared_brightness)
 
     async def async_identify_bulb(self) -> None:
         """Identify the device by flashing it three times."""
         bulb: Light = self.device
-        if bulb.power_level:
+        if self._cancel_identify_off is not None:
+            # An earlier identify turned the bulb on, so restart its timer
+            self.async_cancel_identify()
+        elif bulb.power_level:
             # just flash the bulb for three seconds
             await self.async_set_waveform_optional(value=IDENTIFY_WAVEFORM)
             return
-        # Turn the bulb on first, flash for 3 seconds, then turn off
-        await self.async_set_power(state=True, duration=1)
-        await self.async_set_waveform_optional(value=IDENTIFY_WAVEFORM)
-        await asyncio.sleep(LIFX_IDENTIFY_DELAY)
-        await self.async_set_power(state=False, duration=1)
+
+        async def _async_power_off() -> None:
+            """Turn the bulb back off after it has been identified."""
+            try:
+                await self.async_set_power(state=False, duration=1)
+            except asyncio.TimeoutError:
+                _LOGGER.debug(
+                    "No reply from %s (%s) when turning it off after identify",
+                    self.device.label,
+                    self.device.ip_addr,
+                )
+
+        @callback
+        def _async_identify_off(_: datetime) -> None:
+            """Turn the bulb back off once it has finished flashing."""
+            self._cancel_identify_off = None
+            self.hass.async_create_task(_async_power_off())
+
+        # Turn the bulb on and flash it for 3 seconds, then turn off.
+        # Both messages are sent in order without waiting for the first ack.
+        # The bulb was off before the first identify, so the power off is
+        # (re)scheduled even if these time out.
+        try:
+            await asyncio.gather(
+                self.async_set_power(state=True, duration=1),
+                self.async_set_waveform_optional(value=IDENTIFY_WAVEFORM),
+            )
+        finally:
+            self.async_cancel_identify()
+            self._cancel_identify_off = async_call_later(
+                self.hass, LIFX_IDENTIFY_DELAY, _async_identify_off
+            )
+
+    @callback
+    def async_cancel_identify(self) -> None:
+        """Cancel a pending identify power off."""
+        if self._cancel_identify_off is not None:
+            self._cancel_identify_off()
+            self._cancel_identify_off = None
 
     def async_enable_rssi_updates(self) -> Callable[[], None]:
         """Enable RSSI signal strength updates."""
@@ -448,6 +529,7 @@ class LIFXUpdateCoordinator(DataUpdateCoordinator[None]):
     async def async_update_rssi(self) -> None:
         """Update RSSI value."""
         resp = await async_execute_lifx(self.device.get_wifiinfo)
+        self._last_rssi_update = monotonic()
         self._rssi = int(floor(10 * log10(resp.signal) + 0.5))
 
     def async_get_hev_cycle_state(self) -> bool | None:
@@ -458,18 +540,18 @@ class LIFXUpdateCoordinator(DataUpdateCoordinator[None]):
 
     async def async_get_hev_cycle(self) -> None:
         """Update the HEV cycle status from a LIFX Clean bulb."""
-        if lifx_features(self.device)["hev"]:
+        if self.features["hev"]:
             await async_execute_lifx(self.device.get_hev_cycle)
 
     async def async_set_hev_cycle_state(self, enable: bool, duration: int = 0) -> None:
         """Start or stop an HEV cycle on a LIFX Clean bulb."""
-        if lifx_features(self.device)["hev"]:
+        if self.features["hev"]:
             await async_execute_lifx(
-                partial(self.device.set_hev_cycle, enable=enable, duration=duration)
+                self.device.set_hev_cycle, enable=enable, duration=duration
             )
 
     async def async_apply_theme(self, theme_name: str) -> None:
         """Apply the selected theme to the device."""
         self.last_used_theme = theme_name
-        theme = ThemeLibrary().get_theme(theme_name)
-        await ThemePainter(self.hass.loop).paint(theme, [self.device])
+        theme = THEME_LIBRARY.get_theme(theme_name)
+        await self._painter.paint(theme, [self.device])
@@ -47,9 +47,10 @@ from .manager import (
     SERVICE_EFFECT_STOP,
     LIFXManager,
 )
-from .util import convert_8_to_16, convert_16_to_8, find_hsbk, lifx_features, merge_hsbk
+from .util import convert_8_to_16, convert_16_to_8, find_hsbk, merge_hsbk
 
 LIFX_STATE_SETTLE_DELAY = 0.3
+MAX_CONCURRENT_ZONE_MESSAGES = 4
 
 SERVICE_LIFX_SET_STATE = "set_state"
 
@@ -83,7 +84,6 @@ async def async_setup_entry(
     domain_data = hass.data[DOMAIN]
     coordinator: LIFXUpdateCoordinator = domain_data[entry.entry_id]
     manager: LIFXManager = domain_data[DATA_LIFX_MANAGER]
-    device = coordinator.device
     platform = entity_platform.async_get_current_platform()
     platform.async_register_entity_service(
         SERVICE_LIFX_SET_STATE,
@@ -95,13 +95,14 @@ async def async_setup_entry(
         LIFX_SET_HEV_CYCLE_STATE_SCHEMA,
         "set_hev_cycle_state",
     )
-    if lifx_features(device)["matrix"]:
+    features = coordinator.features
+    if features["matrix"]:
         entity: LIFXLight = LIFXMatrix(coordinator, manager, entry)
-    elif lifx_features(device)["extended_multizone"]:
+    elif features["extended_multizone"]:
         entity = LIFXExtendedMultiZone(coordinator, manager, entry)
-    elif lifx_features(device)["multizone"]:
+    elif features["multizone"]:
         entity = LIFXMultiZone(coordinator, manager, entry)
-    elif lifx_features(device)["color"]:
+    elif features["color"]:
         entity = LIFXColor(coordinator, manager, entry)
     else:
         entity = LIFXWhite(coordinator, manager, entry)
@@ -123,7 +124,7 @@ class LIFXLight(LIFXEntity, LightEntity):
         super().__init__(coordinator)
 
         self.mac_addr = self.bulb.mac_addr
-        bulb_features = lifx_features(self.bulb)
+        bulb_features = coordinator.features
         self.manager = manager
         self.effects_conductor: aiolifx_effects_module.Conductor = (
             manager.effects_conductor
@@ -146,8 +147,9 @@ class LIFXLight(LIFXEntity, LightEntity):
     @property
     def brightness(self) -> int:
         """Return the brightness of this light between 0..255."""
-        fade = self.bulb.power_level / 65535
-        return convert_16_to_8(int(fade * self.bulb.color[HSBK_BRIGHTNESS]))
+        return convert_16_to_8(
+            self.bulb.power_level * self.bulb.color[HSBK_BRIGHTNESS] // 65535
+        )
 
     @property
     def color_temp_kelvin(self) -> int | None:
@@ -269,7 +271,7 @@ class LIFXLight(LIFXEntity, LightEntity):
         self, power: bool, duration: int | None = None
     ) -> None:
         """Set the state of the HEV LEDs on a LIFX Clean bulb."""
-        if lifx_features(self.bulb)["hev"] is False:
+        if self.coordinator.features["hev"] is False:
             raise HomeAssistantError(
                 "This device does not support setting HEV cycle state"
             )
@@ -412,15 +414,35 @@ class LIFXMultiZone(LIFXColor):
 
             zones = list(range(0, num_zones))
         else:
-            zones = [x for x in set(zones) if x < num_zones]
+            zones = sorted({x for x in zones if x < num_zones})
 
-        # Send new color to each zone
-        for index, zone in enumerate(zones):
+        # Adjacent zones that end up with the same color can share a message
+        runs: list[tuple[int, int, list[float | int | None]]] = []
+        for zone in zones:
             zone_hsbk = merge_hsbk(color_zones[zone], hsbk)
-            apply = 1 if (index == len(zones) - 1) else 0
+            if runs and runs[-1][1] == zone - 1 and runs[-1][2] == zone_hsbk:
+                runs[-1] = (runs[-1][0], zone, zone_hsbk)
+            else:
+                runs.append((zone, zone, zone_hsbk))
+
+        # The runs don't overlap, so all but the last can be sent a few at a
+        # time without applying them. The last one applies every change.
+        send_limit = asyncio.Semaphore(MAX_CONCURRENT_ZONE_MESSAGES)
+
+        async def _async_send_run(
+            start_index: int, end_index: int, zone_hsbk: list[float | int | None]
+        ) -> None:
+            async with send_limit:
+                await self.coordinator.async_set_color_zones(
+                    start_index, end_index, zone_hsbk, duration, 0
+                )
+
+        if runs:
+            *pending_runs, (start_index, end_index, zone_hsbk) = runs
             try:
+                await asyncio.gather(*(_async_send_run(*run) for run in pending_runs))
                 await self.coordinator.async_set_color_zones(
-                    zone, zone, zone_hsbk, duration, apply
+                    start_index, end_index, zone_hsbk, duration, 1
                 )
             except asyncio.TimeoutError as ex:
                 raise HomeAssistantError(
@@ -6,7 +6,7 @@ from collections.abc import Callable
 from typing import Any
 
 import aiolifx_effects
-from aiolifx_themes.themes import Theme, ThemeLibrary
+from aiolifx_themes.themes import Theme
 import voluptuous as vol
 
 from homeassistant.components.light import (
@@ -30,7 +30,7 @@ from homeassistant.helpers.service import async_extract_referenced_entity_ids
 
 from .const import ATTR_THEME, DATA_LIFX_MANAGER, DOMAIN
 from .coordinator import LIFXUpdateCoordinator, Light
-from .util import convert_8_to_16, find_hsbk
+from .util import THEME_LIBRARY, convert_8_to_16, find_hsbk
 
 SERVICE_EFFECT_COLORLOOP = "effect_colorloop"
 SERVICE_EFFECT_FLAME = "effect_flame"
@@ -164,7 +164,7 @@ LIFX_EFFECT_MORPH_SCHEMA = cv.make_entity_service_schema(
         **LIFX_EFFECT_SCHEMA,
         ATTR_SPEED: vol.All(vol.Coerce(int), vol.Clamp(min=1, max=25)),
         vol.Exclusive(ATTR_THEME, COLOR_GROUP): vol.Optional(
-            vol.In(ThemeLibrary().themes)
+            vol.In(THEME_LIBRARY.themes)
         ),
         vol.Exclusive(ATTR_PALETTE, COLOR_GROUP): vol.All(
             cv.ensure_list, [HSBK_SCHEMA]
@@ -177,7 +177,7 @@ LIFX_EFFECT_MOVE_SCHEMA = cv.make_entity_service_schema(
         **LIFX_EFFECT_SCHEMA,
         ATTR_SPEED: vol.All(vol.Coerce(float), vol.Clamp(min=0.1, max=60)),
         ATTR_DIRECTION: vol.In(EFFECT_MOVE_DIRECTIONS),
-        ATTR_THEME: vol.Optional(vol.In(ThemeLibrary().themes)),
+        ATTR_THEME: vol.Optional(vol.In(THEME_LIBRARY.themes)),
     }
 )
 
@@ -301,7 +301,7 @@ class LIFXManager:
                 for hsbk in palette:
                     theme.add_hsbk(hsbk[0], hsbk[1], hsbk[2], hsbk[3])
             else:
-                theme = ThemeLibrary().get_theme(theme_name)
+                theme = THEME_LIBRARY.get_theme(theme_name)
 
             await asyncio.gather(
                 *(
@@ -1,8 +1,6 @@
 """Select sensor entities for LIFX integration."""
 from __future__ import annotations
 
-from aiolifx_themes.themes import ThemeLibrary
-
 from homeassistant.components.select import SelectEntity, SelectEntityDescription
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EntityCategory
@@ -17,9 +15,9 @@ from .const import (
 )
 from .coordinator import LIFXUpdateCoordinator
 from .entity import LIFXEntity
-from .util import lifx_features
+from .util import THEME_LIBRARY
 
-THEME_NAMES = [theme_name.lower() for theme_name in ThemeLibrary().themes]
+THEME_NAMES = [theme_name.lower() for theme_name in THEME_LIBRARY.themes]
 
 INFRARED_BRIGHTNESS_ENTITY = SelectEntityDescription(
     key=INFRARED_BRIGHTNESS,
@@ -44,12 +42,12 @@ async def async_setup_entry(
 
     entities: list[LIFXEntity] = []
 
-    if lifx_features(coordinator.device)["infrared"]:
+    if coordinator.features["infrared"]:
         entities.append(
             LIFXInfraredBrightnessSelectEntity(coordinator, INFRARED_BRIGHTNESS_ENTITY)
         )
 
-    if lifx_features(coordinator.device)["multizone"] is True:
+    if coordinator.features["multizone"] is True:
         entities.append(LIFXThemeSelectEntity(coordinator, THEME_ENTITY))
 
     async_add_entities(entities)
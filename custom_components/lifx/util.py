@@ -4,12 +4,13 @@ from __future__ import annotations
 
 import asyncio
 from collections.abc import Callable
+from functools import lru_cache
 from typing import Any
 
 from aiolifx import products
 from aiolifx.aiolifx import Light
 from aiolifx.message import Message
-import async_timeout
+from aiolifx_themes.themes import ThemeLibrary
 from awesomeversion import AwesomeVersion
 
 from homeassistant.components.light import (
@@ -38,6 +39,17 @@ from .const import (
 
 FIX_MAC_FW = AwesomeVersion("3.70")
 
+# Themes are built fresh on each get_theme, so one library can be shared
+THEME_LIBRARY = ThemeLibrary()
+
+# Scale Home Assistant hue (degrees) and saturation (percent) to 16-bit values
+HUE_TO_LIFX = 65535 / 360
+SATURATION_TO_LIFX = 65535 / 100
+
+INFRARED_BRIGHTNESS_OPTIONS_MAP = {
+    option: value for value, option in INFRARED_BRIGHTNESS_VALUES_MAP.items()
+}
+
 
 @callback
 def async_entry_is_legacy(entry: ConfigEntry) -> bool:
@@ -61,8 +73,7 @@ def infrared_brightness_value_to_option(value: int) -> str | None:
 
 def infrared_brightness_option_to_value(option: str) -> int | None:
     """Convert infrared brightness option to value."""
-    option_values = {v: k for k, v in INFRARED_BRIGHTNESS_VALUES_MAP.items()}
-    return option_values.get(option, None)
+    return INFRARED_BRIGHTNESS_OPTIONS_MAP.get(option, None)
 
 
 def convert_8_to_16(value: int) -> int:
@@ -110,8 +121,8 @@ def find_hsbk(hass: HomeAssistant, **kwargs: Any) -> list[float | int | None] |
 
     if hue is not None:
         assert saturation is not None
-        hue = int(hue / 360 * 65535)
-        saturation = int(saturation / 100 * 65535)
+        hue = int(hue * HUE_TO_LIFX)
+        saturation = int(saturation * SATURATION_TO_LIFX)
         kelvin = 3500
 
     if ATTR_KELVIN in kwargs:
@@ -138,8 +149,9 @@ def find_hsbk(hass: HomeAssistant, **kwargs: Any) -> list[float | int | None] |
     if ATTR_BRIGHTNESS_PCT in kwargs:
         brightness = convert_8_to_16(round(255 * kwargs[ATTR_BRIGHTNESS_PCT] / 100))
 
-    hsbk = [hue, saturation, brightness, kelvin]
-    return None if hsbk == [None] * 4 else hsbk
+    if hue is None and saturation is None and brightness is None and kelvin is None:
+        return None
+    return [hue, saturation, brightness, kelvin]
 
 
 def merge_hsbk(
@@ -149,15 +161,25 @@ def merge_hsbk(
 
     Hue, Saturation, Brightness, Kelvin
     """
-    return [b if c is None else c for b, c in zip(base, change)]
+    hue, saturation, brightness, kelvin = change
+    return [
+        base[0] if hue is None else hue,
+        base[1] if saturation is None else saturation,
+        base[2] if brightness is None else brightness,
+        base[3] if kelvin is None else kelvin,
+    ]
 
 
+@lru_cache(maxsize=256)
 def _get_mac_offset(mac_addr: str, offset: int) -> str:
-    octets = [int(octet, 16) for octet in mac_addr.split(":")]
-    octets[5] = (octets[5] + offset) % 256
-    return ":".join(f"{octet:02x}" for octet in octets)
+    value = int(mac_addr.replace(":", ""), 16)
+    # Only the last octet changes, wrapping without carrying into the others
+    value = (value & ~0xFF) | ((value + offset) & 0xFF)
+    hex_mac = f"{value:012x}"
+    return ":".join(hex_mac[i : i + 2] for i in range(0, 12, 2))
 
 
+@lru_cache(maxsize=32)
 def _off_by_one_mac(firmware: str) -> bool:
     """Check if the firmware version has the off by one mac."""
     return bool(firmware and AwesomeVersion(firmware) >= FIX_MAC_FW)
@@ -182,28 +204,26 @@ def mac_matches_serial_number(mac_addr: str, serial_number: str) -> bool:
     )
 
 
-async def async_execute_lifx(method: Callable) -> Message:
-    """Execute a lifx coroutine and wait for a response."""
-    future: asyncio.Future[Message] = asyncio.Future()
+async def async_execute_lifx(method: Callable, *args: Any, **kwargs: Any) -> Message:
+    """Execute a lifx method with the given arguments and wait for a response."""
+    future: asyncio.Future[Message] = asyncio.get_running_loop().create_future()
 
     def _callback(bulb: Light, message: Message) -> None:
+        # The serial number is only unknown until the first response arrives
         if (
-            message is not None
+            bulb.mac_addr == TARGET_ANY
+            and message is not None
             and message.target_addr != TARGET_ANY
-            and bulb.mac_addr == TARGET_ANY
         ):
             bulb.mac_addr = message.target_addr
 
         if not future.done():
             # The future will get canceled out from under
-            # us by async_timeout when we hit the OVERALL_TIMEOUT
+            # us by wait_for when we hit the OVERALL_TIMEOUT
             future.set_result(message)
 
-    method(callb=_callback)
-    result = None
-
-    async with async_timeout.timeout(OVERALL_TIMEOUT):
-        result = await future
+    method(*args, callb=_callback, **kwargs)
+    result = await asyncio.wait_for(future, OVERALL_TIMEOUT)
 
     if result is None:
         raise asyncio.TimeoutError("No response from LIFX bulb")